@@ -26,6 +26,7 @@ Or from the command line::
 """
 
 from .autofix import AutoFixer, CodeFix
+from .cache import ScanCache
 from .linter import GovernanceLinter
 from .rules.base import BaseRule, LintViolation
 from .suppression import SuppressionDetector, SuppressionReport, filter_suppressed
@@ -36,6 +37,7 @@ __all__ = [
     "LintViolation",
     "AutoFixer",
     "CodeFix",
+    "ScanCache",
     "SuppressionDetector",
     "SuppressionReport",
     "filter_suppressed",
@@ -30,7 +30,7 @@ from governance_linter.rules.base import LintViolation
 __all__ = ["AutoFixer", "CodeFix"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeFix:
     """A suggested code fix for a governance lint violation.
 
@@ -66,58 +66,37 @@ class CodeFix:
 # Rule-specific fix templates
 # ---------------------------------------------------------------------------
 
-# Maps rule_id -> (description_template, fix_generator_fn)
-# Fix generators take the violation and return (old_code, new_code, description).
+# Maps rule_id -> (old_code, new_code, description). The templates are fully
+# static — no violation data feeds into them — so they are plain tuples
+# rather than generator functions, saving a call and a tuple build per
+# violation.
 
-def _fix_no_ungoverned_tool_call(violation: LintViolation) -> tuple[str, str, str]:
-    return (
+_RULE_FIX_TEMPLATES: dict[str, tuple[str, str, str]] = {
+    "no-ungoverned-tool-call": (
         "tool.call(",
         "governance.check(action, context)\ntool.call(",
         "Add a governance.check() call before invoking the tool.",
-    )
-
-
-def _fix_no_unlogged_action(violation: LintViolation) -> tuple[str, str, str]:
-    return (
+    ),
+    "no-unlogged-action": (
         "# ungoverned action",
         "audit.log(decision)\n# action now logged",
         "Pass the governance decision to audit.log() to satisfy logging requirement.",
-    )
-
-
-def _fix_no_hardcoded_trust_level(violation: LintViolation) -> tuple[str, str, str]:
-    return (
+    ),
+    "no-hardcoded-trust-level": (
         "trust_level == 3",
         "trust_level == TrustLevel.L3",
         "Replace the numeric literal with a named constant from TrustLevel.",
-    )
-
-
-def _fix_require_consent_check(violation: LintViolation) -> tuple[str, str, str]:
-    return (
+    ),
+    "require-consent-check": (
         "data_store.read(",
         "consent.check(resource, agent_id)\ndata_store.read(",
         "Add a consent.check() call before accessing the data resource.",
-    )
-
-
-def _fix_require_budget_check(violation: LintViolation) -> tuple[str, str, str]:
-    return (
+    ),
+    "require-budget-check": (
         "spend(",
         "budget.check(category, amount)\nspend(",
         "Add a budget.check() call before the spending operation.",
-    )
-
-
-_RULE_FIX_MAP: dict[
-    str,
-    "function" # type: ignore[type-arg]
-] = {  # type: ignore[assignment]
-    "no-ungoverned-tool-call": _fix_no_ungoverned_tool_call,
-    "no-unlogged-action": _fix_no_unlogged_action,
-    "no-hardcoded-trust-level": _fix_no_hardcoded_trust_level,
-    "require-consent-check": _fix_require_consent_check,
-    "require-budget-check": _fix_require_budget_check,
+    ),
 }
 
 
@@ -158,11 +137,11 @@ class AutoFixer:
         CodeFix | None:
             A suggested fix, or ``None`` when no template exists for the rule.
         """
-        fix_generator = _RULE_FIX_MAP.get(violation.rule)
-        if fix_generator is None:
+        template = _RULE_FIX_TEMPLATES.get(violation.rule)
+        if template is None:
             return None
 
-        old_code, new_code, description = fix_generator(violation)
+        old_code, new_code, description = template
         return CodeFix(
             file_path=violation.file,
             old_code=old_code,
@@ -198,4 +177,4 @@ class AutoFixer:
     @property
     def supported_rules(self) -> list[str]:
         """List of rule IDs that have auto-fix templates."""
-        return sorted(_RULE_FIX_MAP.keys())
+        return sorted(_RULE_FIX_TEMPLATES.keys())
@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+Incremental scan cache for governance-linter.
+
+``ScanCache`` stores the violations produced for each (file, rule-set) pair
+so that re-linting an unchanged tree skips both file I/O and AST work.
+Lookups are two-tier:
+
+1. Fast path — the file's ``(st_mtime_ns, st_size)`` pair matches the cached
+   entry; no file read is required.
+2. Slow path — the stat fingerprint changed (e.g. the file was touched) but
+   a BLAKE2b hash of the content still matches; the entry is refreshed.
+
+Entries expire after 24 hours and the cache is trimmed to the 2000 most
+recently used entries on save. The pickle file lives under
+``.governance_lint_cache/`` and concurrent access is serialised with an
+advisory ``flock`` on a sidecar ``.lock`` file (POSIX only; on other
+platforms the lock is a no-op).
+
+Example
+-------
+>>> cache = ScanCache()
+>>> linter = GovernanceLinter(cache=cache)
+>>> linter.lint_directory("src/")
+>>> cache.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from governance_linter.rules.base import LintViolation
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+__all__ = ["ScanCache", "rules_hash"]
+
+# Default directory for the persisted cache, relative to the working directory
+DEFAULT_CACHE_DIR = ".governance_lint_cache"
+
+_CACHE_FILENAME = "cache.pickle"
+_LOCK_FILENAME = ".lock"
+
+# Entries unused for longer than this are dropped on save
+TTL_SECONDS = 24 * 60 * 60
+
+# Maximum number of entries kept on save (least recently used are evicted)
+MAX_ENTRIES = 2000
+
+
+def rules_hash(rule_ids: Iterable[str]) -> str:
+    """Return a stable hash of the enabled rule set.
+
+    Cache entries are keyed on this so that results produced under one rule
+    configuration are never served for another. The package version is
+    mixed in so upgrading the linter invalidates every prior entry — rule
+    behavior may have changed between releases.
+    """
+    from governance_linter import __version__  # deferred: avoids import cycle
+
+    joined = __version__ + "\n" + "\n".join(sorted(rule_ids))
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _content_hash(source: bytes) -> str:
+    """Return a BLAKE2b hash of raw file content."""
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+@dataclass
+class _CacheEntry:
+    """One cached lint result for a (file, rule-set) pair."""
+
+    mtime_ns: int
+    size: int
+    content_hash: str | None
+    violations: list[LintViolation]
+    last_used: float
+
+
+class ScanCache:
+    """Persistent cache of per-file lint results.
+
+    Parameters
+    ----------
+    cache_dir:
+        Directory holding the cache file; created on :meth:`save` if missing.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR) -> None:
+        self.cache_dir = cache_dir
+        self._entries: dict[tuple[str, str], _CacheEntry] = self._load()
+
+    # ── Lookup / store ─────────────────────────────────────────────────────────
+
+    def get(
+        self,
+        filepath: str,
+        rules_key: str,
+        stat_result: os.stat_result,
+        source: bytes | None = None,
+    ) -> list[LintViolation] | None:
+        """Return cached violations for *filepath*, or None on a miss.
+
+        Without *source* only the fast (mtime, size) tier is consulted.
+        With *source* a content-hash match also counts as a hit, refreshing
+        the stored stat fingerprint.
+        """
+        entry = self._entries.get((filepath, rules_key))
+        if entry is None:
+            return None
+
+        now = time.time()
+        if now - entry.last_used > TTL_SECONDS:
+            del self._entries[(filepath, rules_key)]
+            return None
+
+        if (entry.mtime_ns, entry.size) == (stat_result.st_mtime_ns, stat_result.st_size):
+            entry.last_used = now
+            return list(entry.violations)
+
+        if source is not None and entry.content_hash == _content_hash(source):
+            entry.mtime_ns = stat_result.st_mtime_ns
+            entry.size = stat_result.st_size
+            entry.last_used = now
+            return list(entry.violations)
+
+        return None
+
+    def put(
+        self,
+        filepath: str,
+        rules_key: str,
+        stat_result: os.stat_result,
+        violations: list[LintViolation],
+        source: bytes | None = None,
+    ) -> None:
+        """Store *violations* for *filepath* under the given rule-set key."""
+        self._entries[(filepath, rules_key)] = _CacheEntry(
+            mtime_ns=stat_result.st_mtime_ns,
+            size=stat_result.st_size,
+            content_hash=_content_hash(source) if source is not None else None,
+            violations=list(violations),
+            last_used=time.time(),
+        )
+
+    # ── Persistence ────────────────────────────────────────────────────────────
+
+    def save(self) -> None:
+        """Evict stale entries and persist the cache to disk."""
+        now = time.time()
+        live = {
+            key: entry
+            for key, entry in self._entries.items()
+            if now - entry.last_used <= TTL_SECONDS
+        }
+        if len(live) > MAX_ENTRIES:
+            ranked = sorted(live.items(), key=lambda item: item[1].last_used, reverse=True)
+            live = dict(ranked[:MAX_ENTRIES])
+        self._entries = live
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_path = os.path.join(self.cache_dir, _CACHE_FILENAME)
+        with self._locked(), open(cache_path, "wb") as file_handle:
+            pickle.dump(self._entries, file_handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _load(self) -> dict[tuple[str, str], _CacheEntry]:
+        cache_path = os.path.join(self.cache_dir, _CACHE_FILENAME)
+        if not os.path.isfile(cache_path):
+            return {}
+        try:
+            with self._locked(), open(cache_path, "rb") as file_handle:
+                entries = pickle.load(file_handle)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            # A corrupt or unreadable cache is never fatal — start fresh.
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        return entries
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an advisory lock on the sidecar lock file, if supported."""
+        if fcntl is None or not os.path.isdir(self.cache_dir):
+            yield
+            return
+        lock_path = os.path.join(self.cache_dir, _LOCK_FILENAME)
+        with open(lock_path, "a") as lock_handle:
+            fcntl.flock(lock_handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_handle, fcntl.LOCK_UN)
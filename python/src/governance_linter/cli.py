@@ -19,6 +19,10 @@ Usage
       --rules RULE ...  Restrict linting to specific rule IDs.
       --format {text,json}
                         Output format (default: text).
+      --jobs N          Worker processes for directory scans
+                        (default: CPU count; 1 disables parallelism).
+      --cache-dir DIR   Persist lint results under DIR and skip unchanged
+                        files on later runs (disabled unless given).
       -h, --help        Show this help message and exit.
 
 Exit codes
@@ -32,6 +36,7 @@ import argparse
 import os
 import sys
 
+from .cache import ScanCache
 from .linter import DEFAULT_RULES, GovernanceLinter
 from .rules.base import LintViolation
 
@@ -65,6 +70,26 @@ def _build_parser() -> argparse.ArgumentParser:
         default="text",
         help="Output format (default: text).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Number of worker processes used when linting directories "
+            "(default: CPU count; pass 1 to lint serially)."
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        default=None,
+        help=(
+            "Directory for the incremental result cache, e.g. "
+            ".governance_lint_cache. Unchanged files are answered from the "
+            "cache on later runs. Caching is off unless this is given."
+        ),
+    )
     return parser
 
 
@@ -95,20 +120,25 @@ def _resolve_rule_classes(
 
 
 def _collect_violations(
-    linter: GovernanceLinter, paths: list[str]
+    linter: GovernanceLinter, paths: list[str], jobs: int | None = None
 ) -> list[LintViolation]:
     violations: list[LintViolation] = []
+    file_args: list[str] = []
     for path in paths:
         if os.path.isdir(path):
-            violations.extend(linter.lint_directory(path))
+            violations.extend(linter.lint_directory(path, jobs=jobs))
         elif os.path.isfile(path):
-            violations.extend(linter.lint_file(path))
+            file_args.append(path)
         else:
             print(
                 f"governance-lint: path not found: {path}",
                 file=sys.stderr,
             )
             sys.exit(2)
+    if file_args:
+        # File arguments (e.g. from pre-commit's pass_filenames) are linted
+        # as one batch so they share the worker pool.
+        violations.extend(linter.lint_paths(file_args, jobs=jobs))
     return violations
 
 
@@ -118,12 +148,20 @@ def main() -> None:
     args = parser.parse_args()
 
     rule_classes = _resolve_rule_classes(args.rules)
-    linter = GovernanceLinter(rules=rule_classes)  # type: ignore[arg-type]
+    cache = ScanCache(cache_dir=args.cache_dir) if args.cache_dir else None
+    linter = GovernanceLinter(rules=rule_classes, cache=cache)
 
-    violations = _collect_violations(linter, args.paths)
+    violations = _collect_violations(linter, args.paths, jobs=args.jobs)
 
-    output = linter.format_violations(violations, output_format=args.format)
-    print(output)
+    if cache is not None:
+        cache.save()
+
+    # _collect_violations emits violations already grouped per file and
+    # sorted by line within each file, so the formatter needn't re-sort.
+    # Output is streamed to stdout rather than built as one big string.
+    linter.write_violations(
+        violations, sys.stdout, output_format=args.format, assume_sorted=True
+    )
 
     sys.exit(1 if violations else 0)
 
@@ -6,24 +6,168 @@ GovernanceLinter — orchestrates all rules against one file or a directory tree
 """
 
 import ast
+import functools
 import glob
+import itertools
 import json
 import os
-from typing import Literal
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Literal, TextIO
 
+from .cache import ScanCache, rules_hash
 from .rules import ALL_RULES
-from .rules.base import BaseRule, LintViolation
+from .rules.base import BaseRule, CallInfo, LintViolation, iter_visit_methods
 
 # Default rule set — all five governance rules
 DEFAULT_RULES: list[type[BaseRule]] = ALL_RULES
 
+# Files handed to each worker process per task in parallel runs
+_PARALLEL_CHUNKSIZE = 16
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(filepath: str, mtime_ns: int, size: int) -> tuple[str, ast.Module]:
+    """Read and parse *filepath*, memoised on its stat fingerprint.
+
+    Long-lived processes (editor integrations, repeated library calls) lint
+    the same unchanged files repeatedly; keying on ``(path, mtime_ns,
+    size)`` lets them skip both the read and the parse. ``OSError`` and
+    ``SyntaxError`` propagate uncached, so failures are retried on every
+    call.
+    """
+    with open(filepath, encoding="utf-8") as file_handle:
+        source = file_handle.read()
+    return source, ast.parse(source, filename=filepath)
+
+
+# Directory names never descended into during directory scans
+_PRUNE_DIRS: frozenset[str] = frozenset({"__pycache__", ".git", ".venv", "node_modules"})
+
+
+def _iter_py_files(dirpath: str) -> Iterator[str]:
+    """Yield every ``.py`` file under *dirpath* using :func:`os.scandir`.
+
+    ``DirEntry.is_file()`` reuses the type information returned by the
+    directory read, so the walk avoids the per-entry ``stat`` that glob
+    pays. Hidden entries (which glob also skips) and well-known junk
+    directories are pruned without descending into them.
+
+    Entries are sorted within each directory (usually a handful of names),
+    so paths stream out in a deterministic depth-first order and callers
+    never need to sort the full file list.
+    """
+    try:
+        scan = os.scandir(dirpath)
+    except OSError:
+        return
+    with scan:
+        entries = sorted(scan, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in _PRUNE_DIRS:
+                yield from _iter_py_files(entry.path)
+        elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def _lint_one(filepath: str, rule_classes: list[type[BaseRule]]) -> list[LintViolation]:
+    """Lint a single file in a worker process.
+
+    Module-level so it pickles; each worker builds its own linter from the
+    rule classes (picklable by reference) and returns plain violations.
+    """
+    return GovernanceLinter(rules=rule_classes).lint_file(filepath)
+
+
+class FusedDispatcher:
+    """Run every rule's ``visit_*`` handlers in one shared AST traversal.
+
+    Each rule used to walk the tree independently, costing one full pass per
+    rule. The dispatcher instead introspects the rule classes once, builds a
+    per-node-type handler table, and walks the tree a single time with an
+    explicit stack, calling each interested handler in rule order.
+
+    The table is compiled into a generated dispatch-factory: introspection
+    and codegen happen once per linter, and each file only rebinds the
+    factory to its fresh rule instances. The per-node cost is one function
+    call plus an ``is`` chain on node class identity — no ``getattr``,
+    string concatenation, or dict lookup.
+    """
+
+    def __init__(self, rule_classes: list[type[BaseRule]]) -> None:
+        self._make_dispatch = self._compile_factory(rule_classes)
+
+    @staticmethod
+    def _compile_factory(
+        rule_classes: list[type[BaseRule]],
+    ) -> Callable[..., Callable[[ast.AST], None]]:
+        """Generate and compile a dispatch factory hard-coding the rules'
+        handler table.
+
+        The table is fixed per rule-class list, so the type checks and
+        handler calls can be specialised into straight-line code. The
+        returned factory takes one rule instance per class and closes over
+        their bound handlers.
+        """
+        handlers: dict[type[ast.AST], list[tuple[int, str]]] = {}
+        for index, rule_class in enumerate(rule_classes):
+            for node_type, method_name in iter_visit_methods(rule_class):
+                handlers.setdefault(node_type, []).append((index, method_name))
+
+        namespace: dict[str, Any] = {}
+        args = ", ".join(f"rule_{index}" for index in range(len(rule_classes)))
+        lines = [f"def make_dispatch({args}):"]
+
+        # Bind each handler method once per file instead of per node.
+        bound_names: dict[tuple[int, str], str] = {}
+        for callbacks in handlers.values():
+            for index, method_name in callbacks:
+                key = (index, method_name)
+                if key not in bound_names:
+                    bound_names[key] = f"handler_{index}_{method_name}"
+                    lines.append(f"    {bound_names[key]} = rule_{index}.{method_name}")
+
+        lines.append("    def dispatch(node):")
+        lines.append("        node_type = node.__class__")
+        branch = "if"
+        for type_index, (node_type, callbacks) in enumerate(handlers.items()):
+            namespace[f"_type_{type_index}"] = node_type
+            lines.append(f"        {branch} node_type is _type_{type_index}:")
+            for key in callbacks:
+                lines.append(f"            {bound_names[key]}(node)")
+            branch = "elif"
+        if not handlers:
+            lines.append("        pass")
+        lines.append("    return dispatch")
+
+        exec("\n".join(lines), namespace)  # noqa: S102 — static, locally built source
+        factory: Callable[..., Callable[[ast.AST], None]] = namespace["make_dispatch"]
+        return factory
+
+    def walk(self, tree: ast.AST, rules: list[BaseRule]) -> None:
+        """Dispatch every node under *tree* to *rules*' handlers.
+
+        *rules* must be instances of the classes the dispatcher was built
+        from, in the same order.
+        """
+        dispatch = self._make_dispatch(*rules)
+        stack: list[ast.AST] = [tree]
+        while stack:
+            node = stack.pop()
+            dispatch(node)
+            stack.extend(ast.iter_child_nodes(node))
+
 
 class GovernanceLinter:
     """
     AST-based Python linter for governance compliance.
 
     Instantiate with an optional subset of rule classes. If *rules* is
-    omitted all five built-in rules are enabled.
+    omitted all five built-in rules are enabled. Pass a :class:`ScanCache`
+    as *cache* to skip re-linting files whose content has not changed since
+    a previous run (the caller is responsible for calling ``cache.save()``).
 
     Example::
 
@@ -34,8 +178,29 @@ class GovernanceLinter:
         print(linter.format_violations(violations))
     """
 
-    def __init__(self, rules: list[type[BaseRule]] | None = None) -> None:
+    def __init__(
+        self,
+        rules: list[type[BaseRule]] | None = None,
+        cache: ScanCache | None = None,
+    ) -> None:
         self.rule_classes: list[type[BaseRule]] = rules if rules is not None else DEFAULT_RULES
+        self.cache = cache
+        self._rules_hash: str = rules_hash(cls.rule_id for cls in self.rule_classes)
+        self._prefilter_terms: tuple[str, ...] | None = self._build_prefilter()
+        self._dispatcher = FusedDispatcher(self.rule_classes)
+
+    def _build_prefilter(self) -> tuple[str, ...] | None:
+        """Union the enabled rules' trigger terms into one source pre-filter.
+
+        Returns None when any rule declares no trigger terms (meaning it
+        must always run), which disables the pre-filter entirely.
+        """
+        terms: set[str] = set()
+        for rule_class in self.rule_classes:
+            if not rule_class.trigger_terms:
+                return None
+            terms.update(rule_class.trigger_terms)
+        return tuple(sorted(terms))
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
@@ -45,10 +210,16 @@ class GovernanceLinter:
 
         Returns an empty list if the file cannot be parsed (a parse error is
         reported as a single ``parse-error`` violation).
+
+        When a cache is attached, unchanged files are answered from it: first
+        via a stat (mtime, size) fingerprint without reading the file, then
+        via a content hash once the source has been read anyway. Reads and
+        parses are additionally memoised in-process (see ``_parse_cached``)
+        so repeated lints of an unchanged file skip I/O and AST work even
+        without a persistent cache.
         """
         try:
-            with open(filepath, encoding="utf-8") as file_handle:
-                source = file_handle.read()
+            stat_result = os.stat(filepath)
         except OSError as exc:
             return [
                 LintViolation(
@@ -60,78 +231,268 @@ class GovernanceLinter:
                 )
             ]
 
+        if self.cache is not None:
+            cached = self.cache.get(filepath, self._rules_hash, stat_result)
+            if cached is not None:
+                return cached
+
         try:
-            tree = ast.parse(source, filename=filepath)
-        except SyntaxError as exc:
+            source, tree = _parse_cached(
+                filepath, stat_result.st_mtime_ns, stat_result.st_size
+            )
+        except OSError as exc:
             return [
                 LintViolation(
-                    rule="parse-error",
-                    message=f"Syntax error: {exc.msg} (line {exc.lineno})",
+                    rule="io-error",
+                    message=f"Could not read file: {exc}",
                     file=filepath,
-                    line=exc.lineno or 0,
-                    col=exc.offset or 0,
+                    line=0,
+                    col=0,
                 )
             ]
+        except SyntaxError as exc:
+            return [self._parse_error_violation(filepath, exc)]
+
+        source_bytes: bytes | None = None
+        if self.cache is not None:
+            source_bytes = source.encode("utf-8")
+            cached = self.cache.get(
+                filepath, self._rules_hash, stat_result, source=source_bytes
+            )
+            if cached is not None:
+                return cached
+
+        violations = self._run_rules(source, tree, filepath)
 
+        if self.cache is not None:
+            self.cache.put(
+                filepath, self._rules_hash, stat_result, violations, source=source_bytes
+            )
+        return violations
+
+    def lint_source(
+        self, source: str, filename: str = "<string>"
+    ) -> list[LintViolation]:
+        """
+        Run all enabled rules against already-loaded *source*.
+
+        No filesystem access takes place, making this the natural entry
+        point for editor buffers, tests, and other in-memory code. As with
+        :meth:`lint_file`, a syntax error is reported as a single
+        ``parse-error`` violation; *filename* is used for reporting only.
+        """
+        try:
+            tree = ast.parse(source, filename=filename)
+        except SyntaxError as exc:
+            return [self._parse_error_violation(filename, exc)]
+        return self._run_rules(source, tree, filename)
+
+    def _run_rules(
+        self, source: str, tree: ast.Module, filename: str
+    ) -> list[LintViolation]:
+        """Run every enabled rule over the parsed *tree*, sorted by location."""
         violations: list[LintViolation] = []
-        for rule_class in self.rule_classes:
-            rule_instance = rule_class(filename=filepath)
-            rule_instance.visit(tree)
-            violations.extend(rule_instance.violations)
+        if self._source_may_trigger(source):
+            # One shared call-analysis cache per file: whichever rule asks
+            # for a function's calls first walks and classifies them; the
+            # rest reuse the CallInfo list and receiver-name set.
+            calls_cache: dict[int, tuple[list[CallInfo], frozenset[str]]] = {}
+            rule_instances = [
+                rule_class(filename=filename, calls_cache=calls_cache)
+                for rule_class in self.rule_classes
+            ]
+            self._dispatcher.walk(tree, rule_instances)
+            for rule_instance in rule_instances:
+                violations.extend(rule_instance.violations)
 
-        # Sort by line then column for deterministic output
-        violations.sort(key=lambda v: (v.line, v.col))
+            # Sort by line then column for deterministic output
+            violations.sort(key=lambda v: (v.line, v.col))
         return violations
 
+    @staticmethod
+    def _parse_error_violation(filename: str, exc: SyntaxError) -> LintViolation:
+        return LintViolation(
+            rule="parse-error",
+            message=f"Syntax error: {exc.msg} (line {exc.lineno})",
+            file=filename,
+            line=exc.lineno or 0,
+            col=exc.offset or 0,
+        )
+
+    def _source_may_trigger(self, source: str) -> bool:
+        """Return True when *source* could produce a violation at all.
+
+        Every rule only fires on specific identifier fragments, so a file
+        that mentions none of them (the common case in a real codebase) can
+        skip rule traversal entirely. Substring search runs at C speed, so
+        this is effectively a Bloom-filter pass over the raw source.
+        """
+        if self._prefilter_terms is None:
+            return True
+        lowered = source.lower()
+        return any(term in lowered for term in self._prefilter_terms)
+
     def lint_directory(
         self,
         dirpath: str,
         pattern: str = "**/*.py",
+        jobs: int | None = None,
     ) -> list[LintViolation]:
         """
         Recursively scan *dirpath* for Python files matching *pattern* and
         lint each one.
 
+        Each file is parsed and visited independently, so multi-file runs are
+        spread across *jobs* worker processes (default: ``os.cpu_count()``).
+        Pass ``jobs=1`` to lint serially in-process, e.g. for debugging.
+
         Returns a flat list of all violations, sorted by file path then line.
         """
-        all_violations: list[LintViolation] = []
-        glob_pattern = os.path.join(dirpath, pattern)
+        if pattern == "**/*.py":
+            # The walker already yields in a deterministic per-directory
+            # sorted order, so no global sort is needed.
+            matched_files = list(_iter_py_files(dirpath))
+        else:
+            # Custom patterns still go through glob; the scandir fast path
+            # only covers the default "all Python files" case.
+            glob_pattern = os.path.join(dirpath, pattern)
+            matched_files = [
+                filepath
+                for filepath in sorted(glob.glob(glob_pattern, recursive=True))
+                if os.path.isfile(filepath)
+            ]
+
+        return self.lint_paths(matched_files, jobs=jobs)
+
+    def lint_paths(
+        self,
+        paths: Iterable[str],
+        jobs: int | None = None,
+    ) -> list[LintViolation]:
+        """
+        Lint an explicit collection of files, spread across *jobs* worker
+        processes (default: ``os.cpu_count()``; pass ``jobs=1`` for serial).
 
-        matched_files = sorted(glob.glob(glob_pattern, recursive=True))
+        Complements :meth:`lint_directory` for callers that already know
+        which files to lint — changed-file lists from pre-commit hooks or
+        CI diffs. Only path strings cross the process boundary; each worker
+        parses and lints its own files and sends back plain violations.
+        Violations come back grouped per file in *paths* order.
+        """
+        filepaths = list(paths)
+
+        if jobs is None:
+            jobs = os.cpu_count() or 1
 
-        for filepath in matched_files:
-            if not os.path.isfile(filepath):
-                continue
-            all_violations.extend(self.lint_file(filepath))
+        if jobs <= 1 or len(filepaths) < 2:
+            per_file = [self.lint_file(filepath) for filepath in filepaths]
+        else:
+            per_file = self._lint_parallel(filepaths, jobs)
 
-        return all_violations
+        return list(itertools.chain.from_iterable(per_file))
+
+    def _lint_parallel(
+        self, filepaths: list[str], jobs: int
+    ) -> list[list[LintViolation]]:
+        """Lint *filepaths* across *jobs* worker processes.
+
+        When a cache is attached, fast-tier hits are answered in the parent
+        process and only misses are dispatched; results for misses are stored
+        back so the next run hits the cache.
+        """
+        results: dict[str, list[LintViolation]] = {}
+        stats: dict[str, os.stat_result] = {}
+        pending: list[str] = []
+
+        if self.cache is None:
+            pending = list(filepaths)
+        else:
+            for filepath in filepaths:
+                try:
+                    stat_result = os.stat(filepath)
+                except OSError:
+                    pending.append(filepath)
+                    continue
+                cached = self.cache.get(filepath, self._rules_hash, stat_result)
+                if cached is not None:
+                    results[filepath] = cached
+                else:
+                    stats[filepath] = stat_result
+                    pending.append(filepath)
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                worker_results = executor.map(
+                    _lint_one,
+                    pending,
+                    itertools.repeat(self.rule_classes),
+                    chunksize=_PARALLEL_CHUNKSIZE,
+                )
+                for filepath, violations in zip(pending, worker_results, strict=True):
+                    results[filepath] = violations
+                    if self.cache is not None and filepath in stats:
+                        self.cache.put(
+                            filepath, self._rules_hash, stats[filepath], violations
+                        )
+
+        return [results[filepath] for filepath in filepaths]
 
     def format_violations(
         self,
         violations: list[LintViolation],
         output_format: Literal["text", "json"] = "text",
+        assume_sorted: bool = False,
     ) -> str:
         """
         Format *violations* for display.
 
         *output_format* can be ``"text"`` (one line per violation, default)
         or ``"json"`` (a JSON array suitable for tooling integration).
+
+        Pass ``assume_sorted=True`` to skip the defensive re-sort when the
+        violations are already grouped by file and ordered by line — which
+        is what :meth:`lint_file` and :meth:`lint_directory` produce.
         """
         if output_format == "json":
             return self._format_json(violations)
-        return self._format_text(violations)
+        return self._format_text(violations, assume_sorted=assume_sorted)
+
+    def write_violations(
+        self,
+        violations: list[LintViolation],
+        stream: TextIO,
+        output_format: Literal["text", "json"] = "text",
+        assume_sorted: bool = False,
+    ) -> None:
+        """
+        Write formatted *violations* to *stream* without building the whole
+        output in memory first.
+
+        JSON output is emitted record by record, so only one violation's
+        encoding is alive at a time; text output matches
+        :meth:`format_violations`.
+        """
+        if output_format == "json":
+            for chunk in self._iter_json_chunks(violations):
+                stream.write(chunk)
+        else:
+            stream.write(self._format_text(violations, assume_sorted=assume_sorted))
+        stream.write("\n")
 
     # ── Formatting helpers ─────────────────────────────────────────────────────
 
     @staticmethod
-    def _format_text(violations: list[LintViolation]) -> str:
+    def _format_text(violations: list[LintViolation], assume_sorted: bool = False) -> str:
         if not violations:
             return "No governance violations found."
 
+        if not assume_sorted:
+            violations = sorted(violations, key=lambda v: (v.file, v.line, v.col))
+
         lines: list[str] = []
         current_file: str | None = None
 
-        for violation in sorted(violations, key=lambda v: (v.file, v.line, v.col)):
+        for violation in violations:
             if violation.file != current_file:
                 if current_file is not None:
                     lines.append("")
@@ -148,16 +509,33 @@ class GovernanceLinter:
         )
         return "\n".join(lines)
 
+    @classmethod
+    def _format_json(cls, violations: list[LintViolation]) -> str:
+        return "".join(cls._iter_json_chunks(violations))
+
     @staticmethod
-    def _format_json(violations: list[LintViolation]) -> str:
-        records = [
-            {
-                "rule": v.rule,
-                "message": v.message,
-                "file": v.file,
-                "line": v.line,
-                "col": v.col,
+    def _iter_json_chunks(violations: list[LintViolation]) -> Iterator[str]:
+        """Yield the JSON array for *violations* one record at a time.
+
+        The chunks concatenate to exactly what ``json.dumps(records,
+        indent=2)`` would produce, but only a single record dict and its
+        encoding are ever held in memory.
+        """
+        if not violations:
+            yield "[]"
+            return
+
+        encoder = json.JSONEncoder(indent=2)
+        for index, violation in enumerate(violations):
+            record = {
+                "rule": violation.rule,
+                "message": violation.message,
+                "file": violation.file,
+                "line": violation.line,
+                "col": violation.col,
             }
-            for v in violations
-        ]
-        return json.dumps(records, indent=2)
+            encoded = "\n".join(
+                "  " + line for line in encoder.encode(record).splitlines()
+            )
+            yield ("[\n" if index == 0 else ",\n") + encoded
+        yield "\n]"
@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 MuVeraAI Corporation
+
+"""
+Hot-path kernels shared by the governance lint rules.
+
+These are the tight per-node predicates and traversals that dominate lint
+time. They are deliberately written as module-level functions with
+positional-only parameters, localised class references, and identity type
+checks — the shape a compiled backend (Cython / C extension) would take —
+so an accelerated implementation can replace this module wholesale without
+touching the rules. The pure-Python versions here are the reference
+implementation and the only one shipped.
+"""
+
+import ast
+from collections.abc import Callable, Iterator
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = [
+    "CallInfo",
+    "classify_call",
+    "format_callee",
+    "is_method_call",
+    "iter_call_info",
+    "iter_calls",
+    "make_method_matcher",
+]
+
+# Localised class references: one global load instead of two attribute
+# lookups per check inside the hot loops.
+_Attribute = ast.Attribute
+_Call = ast.Call
+_Name = ast.Name
+
+
+@dataclass(frozen=True, slots=True)
+class CallInfo:
+    """Pre-classified view of one :class:`ast.Call` node.
+
+    Classifying each call once at collection time means every rule tests
+    plain string fields against its sets instead of re-running the
+    isinstance chain and attribute lookups per rule per call.
+    """
+
+    lineno: int
+    col: int
+    obj: str | None
+    """Receiver name for ``obj.method(...)`` calls, else None."""
+    method: str | None
+    """Method name for ``obj.method(...)`` calls, else None."""
+    func_name: str | None
+    """Callee name for bare ``name(...)`` calls, else None."""
+    node: ast.Call
+    """The underlying call node, for reporting."""
+
+
+def classify_call(node: ast.Call, /) -> CallInfo:
+    """Return the :class:`CallInfo` classification of *node*."""
+    func = node.func
+    obj = method = func_name = None
+    if func.__class__ is _Attribute:
+        value = func.value
+        if value.__class__ is _Name:
+            obj = value.id
+            method = func.attr
+    elif func.__class__ is _Name:
+        func_name = func.id
+    return CallInfo(node.lineno, node.col_offset, obj, method, func_name, node)
+
+
+def format_callee(info: CallInfo, /) -> str:
+    """Return ``"obj.method"`` for the call described by *info*, or
+    ``"<unknown>"`` when it is not a simple method call."""
+    if info.obj is not None:
+        return f"{info.obj}.{info.method}"
+    return "<unknown>"
+
+
+def is_method_call(
+    node: ast.Call, objects: AbstractSet[str], methods: AbstractSet[str], /
+) -> bool:
+    """Return True when *node* is ``obj.method(...)`` with ``obj`` in
+    *objects* and ``method`` in *methods*."""
+    func = node.func
+    if func.__class__ is not _Attribute:
+        return False
+    value = func.value
+    if value.__class__ is not _Name:
+        return False
+    return value.id in objects and func.attr in methods
+
+
+def make_method_matcher(
+    objects: AbstractSet[str], methods: AbstractSet[str], /
+) -> Callable[[CallInfo], bool]:
+    """Compile a predicate specialised for one ``(objects, methods)`` pair.
+
+    The returned function takes a :class:`CallInfo` and reports whether it
+    describes ``obj.method(...)`` with ``obj`` in *objects* and ``method``
+    in *methods*. Both sets are bound as closure constants at build time,
+    so the generated body is two cell-variable membership tests with no
+    global lookups — the same partial-evaluation trick as the
+    orchestrator's dispatch factory. Rules build their matchers once at
+    module import and call them directly in the per-call loops.
+    """
+    namespace: dict[str, Any] = {}
+    source = (
+        "def _bind(_objects, _methods):\n"
+        "    def match(info, /):\n"
+        "        return info.obj in _objects and info.method in _methods\n"
+        "    return match\n"
+    )
+    exec(source, namespace)  # noqa: S102 — static, locally built source
+    matcher: Callable[[CallInfo], bool] = namespace["_bind"](
+        frozenset(objects), frozenset(methods)
+    )
+    return matcher
+
+
+def iter_calls(tree: ast.AST, /) -> Iterator[ast.Call]:
+    """Yield every :class:`ast.Call` node in *tree*.
+
+    Uses an explicit list stack instead of :func:`ast.walk`, avoiding the
+    deque operations and per-node generator resumption walk pays; iteration
+    order is unspecified (callers filter by line number, not position).
+    """
+    iter_child_nodes = ast.iter_child_nodes
+    stack = [tree]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        if node.__class__ is _Call:
+            yield node
+        extend(iter_child_nodes(node))
+
+
+def iter_call_info(tree: ast.AST, /) -> Iterator[CallInfo]:
+    """Yield a :class:`CallInfo` for every call in *tree*.
+
+    Fuses :func:`iter_calls` and :func:`classify_call` into a single
+    traversal, so streaming consumers classify calls without building an
+    intermediate call-node list. Iteration order is unspecified, as with
+    :func:`iter_calls`.
+    """
+    classify = classify_call
+    iter_child_nodes = ast.iter_child_nodes
+    stack = [tree]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        if node.__class__ is _Call:
+            yield classify(node)
+        extend(iter_child_nodes(node))
@@ -6,10 +6,24 @@ Base class and shared data types for governance lint rules.
 """
 
 import ast
+import sys
+from collections.abc import Callable, Iterator
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 
+from . import _fast
+from ._fast import CallInfo
 
-@dataclass(frozen=True)
+__all__ = [
+    "BaseRule",
+    "CallInfo",
+    "LintViolation",
+    "iter_visit_handlers",
+    "iter_visit_methods",
+]
+
+
+@dataclass(frozen=True, slots=True)
 class LintViolation:
     """An individual governance violation detected in a source file."""
 
@@ -32,6 +46,39 @@ class LintViolation:
         return f"{self.file}:{self.line}:{self.col}: [{self.rule}] {self.message}"
 
 
+def iter_visit_methods(
+    rule_class: type["BaseRule"],
+) -> Iterator[tuple[type[ast.AST], str]]:
+    """Yield ``(node_type, method_name)`` for each ``visit_*`` method that
+    *rule_class*'s hierarchy defines.
+
+    Only methods declared below :class:`ast.NodeVisitor` are considered, so
+    the stdlib's deprecation shims (``visit_Constant`` etc.) are excluded.
+    Works on the class, so the result can be computed once and reused for
+    every instance.
+    """
+    seen: set[str] = set()
+    for klass in rule_class.__mro__:
+        if klass is ast.NodeVisitor:
+            break
+        for name in vars(klass):
+            if not name.startswith("visit_") or name in seen:
+                continue
+            seen.add(name)
+            node_type = getattr(ast, name[len("visit_") :], None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                yield node_type, name
+
+
+def iter_visit_handlers(
+    rule: "BaseRule",
+) -> Iterator[tuple[type[ast.AST], Callable[[ast.AST], None]]]:
+    """Yield ``(node_type, bound_handler)`` for each ``visit_*`` method of
+    *rule* — the instance-bound view of :func:`iter_visit_methods`."""
+    for node_type, name in iter_visit_methods(type(rule)):
+        yield node_type, getattr(rule, name)
+
+
 class BaseRule(ast.NodeVisitor):
     """
     Base class for all governance lint rules.
@@ -40,16 +87,51 @@ class BaseRule(ast.NodeVisitor):
     override ``visit_*`` methods to detect violations and call
     :meth:`report`.
 
-    The linter instantiates each rule with the filename being scanned, then
-    calls :meth:`visit` on the module-level AST node.
+    The linter instantiates each rule with the filename being scanned. The
+    traversal itself is driven externally — either by the orchestrator's
+    fused single-pass walk over all rules at once, or by :meth:`visit` when
+    a rule is run standalone. ``visit_*`` handlers therefore must not call
+    ``generic_visit``; every node in the tree is dispatched exactly once.
     """
 
     rule_id: str = ""
     description: str = ""
 
-    def __init__(self, filename: str) -> None:
-        self.filename = filename
+    #: Lowercase identifier fragments, at least one of which must appear in
+    #: the raw source for this rule to possibly fire. The orchestrator uses
+    #: the union across enabled rules as a cheap pre-filter. An empty set
+    #: disables the pre-filter and the rule always runs.
+    trigger_terms: frozenset[str] = frozenset()
+
+    def __init__(
+        self,
+        filename: str,
+        calls_cache: dict[int, tuple[list[CallInfo], frozenset[str]]] | None = None,
+    ) -> None:
+        # Interned: every violation for this file shares one path string and
+        # one rule-ID string instead of carrying duplicate copies.
+        self.filename = sys.intern(filename)
+        self._rule_id = sys.intern(self.rule_id) if self.rule_id else self.rule_id
         self.violations: list[LintViolation] = []
+        # Memoised per-function call analysis (CallInfo list plus receiver
+        # name set) keyed on id(node). The orchestrator
+        # hands the same dict to every rule instance for a file, so each
+        # function body is walked once regardless of how many rules inspect
+        # it. Keying on id() is safe because the cache only lives for one
+        # lint run, during which the tree is strongly referenced.
+        self._calls_cache = calls_cache if calls_cache is not None else {}
+
+    def visit(self, node: ast.AST) -> None:
+        """Walk the whole tree under *node*, dispatching each descendant to
+        its ``visit_*`` handler via a single explicit-stack traversal."""
+        handlers = dict(iter_visit_handlers(self))
+        stack: list[ast.AST] = [node]
+        while stack:
+            current = stack.pop()
+            handler = handlers.get(type(current))
+            if handler is not None:
+                handler(current)
+            stack.extend(ast.iter_child_nodes(current))
 
     def report(self, node: ast.AST, message: str) -> None:
         """Record a violation at the location of *node*."""
@@ -57,7 +139,7 @@ class BaseRule(ast.NodeVisitor):
         col = getattr(node, "col_offset", 0)
         self.violations.append(
             LintViolation(
-                rule=self.rule_id,
+                rule=self._rule_id,
                 message=message,
                 file=self.filename,
                 line=line,
@@ -68,55 +150,82 @@ class BaseRule(ast.NodeVisitor):
     # ── Helpers available to all rule subclasses ──────────────────────────────
 
     @staticmethod
-    def is_method_call(node: ast.Call, *, objects: set[str], methods: set[str]) -> bool:
+    def is_method_call(
+        node: ast.Call, objects: AbstractSet[str], methods: AbstractSet[str]
+    ) -> bool:
         """
         Return True when *node* is a call of the form ``obj.method(...)``
         where ``obj`` is in *objects* and ``method`` is in *methods*.
+
+        Thin wrapper over the :mod:`governance_linter.rules._fast` kernel.
+        """
+        return _fast.is_method_call(node, objects, methods)
+
+    def collect_call_info(self, tree: ast.AST) -> list[CallInfo]:
+        """Return a :class:`CallInfo` for every call in *tree* (order
+        unspecified).
+
+        Each call is classified exactly once; rules then match against plain
+        string fields (``info.obj in OBJECTS and info.method in METHODS``)
+        instead of re-walking the ``func`` attribute chain per rule. The
+        list is materialised exactly once — from the streaming
+        :func:`~governance_linter.rules._fast.iter_call_info` kernel — and
+        memoised in the per-file cache shared across rules, so the subtree
+        is only traversed by the first rule that asks.
         """
-        if not isinstance(node.func, ast.Attribute):
-            return False
-        attribute = node.func
-        if not isinstance(attribute.value, ast.Name):
-            return False
-        return attribute.value.id in objects and attribute.attr in methods
+        return self._analyze_calls(tree)[0]
 
-    @staticmethod
-    def collect_calls(tree: ast.AST) -> list[ast.Call]:
-        """Return all :class:`ast.Call` nodes in *tree* (pre-order)."""
-        return [node for node in ast.walk(tree) if isinstance(node, ast.Call)]
+    def collect_call_objects(self, tree: ast.AST) -> frozenset[str]:
+        """Return every receiver name used in a call under *tree*.
+
+        A rule whose anchor objects (tool / spend / governance handles) are
+        absent from this set cannot fire, so checking the intersection up
+        front replaces a Python-level scan of the call list with one
+        C-speed set operation. Shares the memoised analysis of
+        :meth:`collect_call_info`.
+        """
+        return self._analyze_calls(tree)[1]
+
+    def _analyze_calls(
+        self, tree: ast.AST
+    ) -> tuple[list[CallInfo], frozenset[str]]:
+        key = id(tree)
+        entry = self._calls_cache.get(key)
+        if entry is None:
+            infos = list(_fast.iter_call_info(tree))
+            objects = frozenset(
+                info.obj for info in infos if info.obj is not None
+            )
+            entry = (infos, objects)
+            self._calls_cache[key] = entry
+        return entry
 
     @staticmethod
     def calls_before(
-        calls: list[ast.Call],
+        calls: list[CallInfo],
         target_line: int,
         *,
-        objects: set[str],
-        methods: set[str],
+        objects: AbstractSet[str],
+        methods: AbstractSet[str],
     ) -> bool:
         """
         Return True when at least one call matching *objects* / *methods*
         appears before *target_line* in the given call list.
         """
-        for call in calls:
-            call_line = getattr(call, "lineno", float("inf"))
-            if call_line >= target_line:
-                continue
-            if BaseRule.is_method_call(call, objects=objects, methods=methods):
+        for info in calls:
+            if info.lineno < target_line and info.obj in objects and info.method in methods:
                 return True
         return False
 
     @staticmethod
     def calls_exist(
-        calls: list[ast.Call],
+        calls: list[CallInfo],
         *,
-        objects: set[str],
-        methods: set[str],
+        objects: AbstractSet[str],
+        methods: AbstractSet[str],
     ) -> bool:
         """
         Return True when at least one call matching *objects* / *methods*
         exists anywhere in the given call list.
         """
-        return any(
-            BaseRule.is_method_call(call, objects=objects, methods=methods)
-            for call in calls
-        )
+        return any(info.obj in objects and info.method in methods for info in calls)
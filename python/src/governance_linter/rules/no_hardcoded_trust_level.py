@@ -27,7 +27,13 @@ import re
 
 from .base import BaseRule
 
-# Regex matching identifier fragments that suggest a trust-level variable
+# Identifier fragments that suggest a trust-level variable. Checked with
+# plain lowercase substring tests — far cheaper than regex alternation on
+# the per-comparand hot path.
+_TRUST_KEYWORDS: tuple[str, ...] = ("trust", "level", "tier", "clearance")
+
+# Regex equivalent of _TRUST_KEYWORDS, kept for callers that substitute
+# their own pattern; the default hot path does not use it.
 TRUST_PATTERN: re.Pattern[str] = re.compile(r"trust|level|tier|clearance", re.IGNORECASE)
 
 # Numeric comparison operators in the AST
@@ -44,13 +50,24 @@ COMPARISON_OPS: set[type[ast.cmpop]] = {
 MAX_MAGIC_VALUE = 5
 
 
+def _is_trust_name(name: str) -> bool:
+    """Return True when *name* contains one of the trust-level keywords."""
+    lowered = name.lower()
+    return any(keyword in lowered for keyword in _TRUST_KEYWORDS)
+
+
 def _contains_trust_name(node: ast.expr) -> bool:
-    """Return True when *node* contains a name fragment matching TRUST_PATTERN."""
-    if isinstance(node, ast.Name):
-        return bool(TRUST_PATTERN.search(node.id))
-    if isinstance(node, ast.Attribute):
-        return _contains_trust_name(node.value) or bool(TRUST_PATTERN.search(node.attr))
-    return False
+    """Return True when *node* contains a trust-suggesting name fragment.
+
+    Walks attribute chains (``obj.user.trust.level``) iteratively rather
+    than recursing, so deep chains cost attribute hops instead of stack
+    frames.
+    """
+    while isinstance(node, ast.Attribute):
+        if _is_trust_name(node.attr):
+            return True
+        node = node.value
+    return isinstance(node, ast.Name) and _is_trust_name(node.id)
 
 
 def _is_small_int_literal(node: ast.expr) -> bool:
@@ -66,6 +83,7 @@ class NoHardcodedTrustLevel(BaseRule):
     """Flag magic numeric literals used in trust-level comparisons."""
 
     rule_id = "no-hardcoded-trust-level"
+    trigger_terms = frozenset(_TRUST_KEYWORDS)
     description = (
         "Disallow numeric literals (0–5) in trust-level comparisons. Use named "
         "constants instead of magic numbers so the trust model is explicit and "
@@ -86,12 +104,10 @@ class NoHardcodedTrustLevel(BaseRule):
             self._check_pair(left, comparator)
             left = comparator  # slide the window for chained comparisons
 
-        self.generic_visit(node)
-
     def _check_pair(self, left: ast.expr, right: ast.expr) -> None:
         # Pattern A: trust_identifier OP numeric_literal
         if _contains_trust_name(left) and _is_small_int_literal(right):
-            value = right.value  # type: ignore[union-attr]
+            value = right.value  # type: ignore[attr-defined]
             self.report(
                 right,
                 f"Magic number {value} used in a trust comparison. Replace with a "
@@ -102,7 +118,7 @@ class NoHardcodedTrustLevel(BaseRule):
 
         # Pattern B: numeric_literal OP trust_identifier (reversed)
         if _is_small_int_literal(left) and _contains_trust_name(right):
-            value = left.value  # type: ignore[union-attr]
+            value = left.value  # type: ignore[attr-defined]
             self.report(
                 left,
                 f"Magic number {value} used in a trust comparison. Replace with a "
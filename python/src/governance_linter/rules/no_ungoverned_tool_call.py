@@ -15,31 +15,41 @@ perform arbitrary actions without policy enforcement.
 
 import ast
 
+from ._fast import format_callee, make_method_matcher
 from .base import BaseRule
 
 # Object names treated as tool handles
-TOOL_OBJECTS: set[str] = {"tool", "tools", "agent", "executor"}
+TOOL_OBJECTS: frozenset[str] = frozenset({"tool", "tools", "agent", "executor"})
 
 # Method names treated as tool invocation verbs
-TOOL_METHODS: set[str] = {"run", "execute", "invoke", "call", "dispatch"}
+TOOL_METHODS: frozenset[str] = frozenset({"run", "execute", "invoke", "call", "dispatch"})
 
 # Object names that carry a governance / trust check
-GOVERNANCE_OBJECTS: set[str] = {"engine", "governance", "trust", "policy", "aumos"}
+GOVERNANCE_OBJECTS: frozenset[str] = frozenset(
+    {"engine", "governance", "trust", "policy", "aumos"}
+)
 
 # Method names that constitute a governance check
-GOVERNANCE_METHODS: set[str] = {
-    "check",
-    "verify",
-    "validate",
-    "authorize",
-    "permit",
-}
+GOVERNANCE_METHODS: frozenset[str] = frozenset(
+    {
+        "check",
+        "verify",
+        "validate",
+        "authorize",
+        "permit",
+    }
+)
+
+# Specialised matchers with the set constants bound as closure cells
+_is_governance_check = make_method_matcher(GOVERNANCE_OBJECTS, GOVERNANCE_METHODS)
+_is_tool_call = make_method_matcher(TOOL_OBJECTS, TOOL_METHODS)
 
 
 class NoUngovernedToolCall(BaseRule):
     """Flag tool invocations that lack a prior governance check in the same scope."""
 
     rule_id = "no-ungoverned-tool-call"
+    trigger_terms = TOOL_OBJECTS
     description = (
         "Require a governance check before every tool invocation. Tool calls "
         "without a prior engine.check() / governance.check() in the same scope "
@@ -48,42 +58,44 @@ class NoUngovernedToolCall(BaseRule):
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         self._check_function_body(node)
-        self.generic_visit(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         self._check_function_body(node)
-        self.generic_visit(node)
 
     def _check_function_body(
         self, func_node: ast.FunctionDef | ast.AsyncFunctionDef
     ) -> None:
         """Walk all calls in this function and flag ungoverned tool calls."""
-        all_calls = self.collect_calls(func_node)
-
-        for call in all_calls:
-            if not self.is_method_call(call, objects=TOOL_OBJECTS, methods=TOOL_METHODS):
+        # No tool handle is ever called in this function — nothing can fire.
+        if not (self.collect_call_objects(func_node) & TOOL_OBJECTS):
+            return
+
+        all_calls = self.collect_call_info(func_node)
+
+        # Every tool call only asks "does any governance check precede me?",
+        # so the earliest governance-call line answers all of them in one
+        # pass instead of re-scanning the call list per tool call.
+        first_check_line: int | None = None
+        for info in all_calls:
+            if _is_governance_check(info) and (
+                first_check_line is None or info.lineno < first_check_line
+            ):
+                first_check_line = info.lineno
+
+        for info in all_calls:
+            if not _is_tool_call(info):
                 continue
 
-            target_line: int = getattr(call, "lineno", 0)
-
-            has_prior_check = self.calls_before(
-                all_calls,
-                target_line,
-                objects=GOVERNANCE_OBJECTS,
-                methods=GOVERNANCE_METHODS,
+            has_prior_check = (
+                first_check_line is not None and first_check_line < info.lineno
             )
 
             if not has_prior_check:
-                callee_text = self._format_callee(call)
+                callee_text = format_callee(info)
                 self.report(
-                    call,
+                    info.node,
                     f"'{callee_text}' is a tool invocation but no governance check "
                     "(e.g. engine.check() or governance.check()) was found before it "
                     "in the enclosing function. Add a check to authorise this action.",
                 )
 
-    @staticmethod
-    def _format_callee(call: ast.Call) -> str:
-        if isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name):
-            return f"{call.func.value.id}.{call.func.attr}"
-        return "<unknown>"
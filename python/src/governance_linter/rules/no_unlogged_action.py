@@ -16,25 +16,26 @@ audited, which breaks compliance requirements.
 
 import ast
 
+from ._fast import CallInfo, format_callee, make_method_matcher
 from .base import BaseRule
 
 # Object names that perform a governance / trust check
-GOVERNANCE_OBJECTS: set[str] = {"engine", "governance", "trust", "policy", "aumos"}
+GOVERNANCE_OBJECTS: frozenset[str] = frozenset({"engine", "governance", "trust", "policy", "aumos"})
 
 # Method names that constitute a governance check
-GOVERNANCE_METHODS: set[str] = {
+GOVERNANCE_METHODS: frozenset[str] = frozenset({
     "check",
     "verify",
     "validate",
     "authorize",
     "permit",
-}
+})
 
 # Object names associated with audit / structured logging
-AUDIT_OBJECTS: set[str] = {"audit", "logger", "log", "auditLog"}
+AUDIT_OBJECTS: frozenset[str] = frozenset({"audit", "logger", "log", "auditLog"})
 
 # Method names for audit / structured logging
-AUDIT_METHODS: set[str] = {
+AUDIT_METHODS: frozenset[str] = frozenset({
     "log",
     "write",
     "record",
@@ -43,16 +44,23 @@ AUDIT_METHODS: set[str] = {
     "debug",
     "warn",
     "error",
-}
+})
 
 # Standalone function names treated as audit log calls
-AUDIT_FUNCTIONS: set[str] = {"auditLog", "auditAction", "logAction", "recordAction"}
+AUDIT_FUNCTIONS: frozenset[str] = frozenset(
+    {"auditLog", "auditAction", "logAction", "recordAction"}
+)
+
+# Specialised matchers with the set constants bound as closure cells
+_is_governance_check = make_method_matcher(GOVERNANCE_OBJECTS, GOVERNANCE_METHODS)
+_is_audit_call = make_method_matcher(AUDIT_OBJECTS, AUDIT_METHODS)
 
 
 class NoUnloggedAction(BaseRule):
     """Flag governance checks that have no corresponding audit log call in the same scope."""
 
     rule_id = "no-unlogged-action"
+    trigger_terms = GOVERNANCE_OBJECTS
     description = (
         "Require that every governance check is followed by an audit log call in "
         "the same function scope. Un-logged governance decisions break audit trails."
@@ -60,48 +68,44 @@ class NoUnloggedAction(BaseRule):
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         self._check_function_body(node)
-        self.generic_visit(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         self._check_function_body(node)
-        self.generic_visit(node)
 
     def _check_function_body(
         self, func_node: ast.FunctionDef | ast.AsyncFunctionDef
     ) -> None:
-        all_calls = self.collect_calls(func_node)
-
-        for call in all_calls:
-            if not self.is_method_call(
-                call, objects=GOVERNANCE_OBJECTS, methods=GOVERNANCE_METHODS
-            ):
+        # No governance handle is ever called in this function — nothing
+        # can fire.
+        if not (self.collect_call_objects(func_node) & GOVERNANCE_OBJECTS):
+            return
+
+        all_calls = self.collect_call_info(func_node)
+
+        # Whether any audit log call exists anywhere in the function (it need
+        # not precede the check — the log may be in a then-branch or finally)
+        # is a property of the whole function, so compute it once rather than
+        # re-scanning the call list for every governance call.
+        has_audit_log = any(
+            _is_audit_call(info) for info in all_calls
+        ) or self._has_audit_function_call(all_calls)
+        if has_audit_log:
+            return
+
+        for info in all_calls:
+            if not _is_governance_check(info):
                 continue
 
-            # Check whether any audit log call exists anywhere in the function
-            # (it need not precede the check — the log may be in a then-branch or finally)
-            has_audit_log = self.calls_exist(
-                all_calls, objects=AUDIT_OBJECTS, methods=AUDIT_METHODS
-            ) or self._has_audit_function_call(all_calls)
-
-            if not has_audit_log:
-                callee_text = self._format_callee(call)
-                self.report(
-                    call,
-                    f"'{callee_text}' is a governance check but no audit log call "
-                    "(e.g. audit.log() or logger.log()) was found in the enclosing "
-                    "function. Log the outcome so it can be audited.",
-                )
+            callee_text = format_callee(info)
+            self.report(
+                info.node,
+                f"'{callee_text}' is a governance check but no audit log call "
+                "(e.g. audit.log() or logger.log()) was found in the enclosing "
+                "function. Log the outcome so it can be audited.",
+            )
 
     @staticmethod
-    def _has_audit_function_call(calls: list[ast.Call]) -> bool:
+    def _has_audit_function_call(calls: list[CallInfo]) -> bool:
         """Return True if any standalone audit function is called."""
-        for call in calls:
-            if isinstance(call.func, ast.Name) and call.func.id in AUDIT_FUNCTIONS:
-                return True
-        return False
+        return any(info.func_name in AUDIT_FUNCTIONS for info in calls)
 
-    @staticmethod
-    def _format_callee(call: ast.Call) -> str:
-        if isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name):
-            return f"{call.func.value.id}.{call.func.attr}"
-        return "<unknown>"
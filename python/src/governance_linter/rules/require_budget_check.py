@@ -18,10 +18,11 @@ blocked if the budget is insufficient.
 
 import ast
 
+from ._fast import format_callee, make_method_matcher
 from .base import BaseRule
 
 # Object names that incur a spend / resource cost
-SPEND_OBJECTS: set[str] = {
+SPEND_OBJECTS: frozenset[str] = frozenset({
     "api",
     "openai",
     "anthropic",
@@ -30,10 +31,10 @@ SPEND_OBJECTS: set[str] = {
     "tokens",
     "completion",
     "embedding",
-}
+})
 
 # Method names that constitute a spending operation
-SPEND_METHODS: set[str] = {
+SPEND_METHODS: frozenset[str] = frozenset({
     "call",
     "chat",
     "complete",
@@ -45,26 +46,33 @@ SPEND_METHODS: set[str] = {
     "create_completion",
     "create_chat_completion",
     "create",
-}
+})
 
 # Object names that perform budget / quota checks
-BUDGET_OBJECTS: set[str] = {"budget", "cost", "quota", "spend", "billing", "tokens"}
+BUDGET_OBJECTS: frozenset[str] = frozenset(
+    {"budget", "cost", "quota", "spend", "billing", "tokens"}
+)
 
 # Method names that constitute a budget check
-BUDGET_METHODS: set[str] = {
+BUDGET_METHODS: frozenset[str] = frozenset({
     "check",
     "verify",
     "can_spend",
     "has_quota",
     "authorize",
     "reserve",
-}
+})
+
+# Specialised matchers with the set constants bound as closure cells
+_is_budget_check = make_method_matcher(BUDGET_OBJECTS, BUDGET_METHODS)
+_is_spend_call = make_method_matcher(SPEND_OBJECTS, SPEND_METHODS)
 
 
 class RequireBudgetCheck(BaseRule):
     """Flag spending / LLM calls that lack a prior budget check in the same scope."""
 
     rule_id = "require-budget-check"
+    trigger_terms = SPEND_OBJECTS
     description = (
         "Require a budget check before spending operations (LLM calls, external API "
         "calls, token usage). Calls to openai.chat(), llm.complete(), tokens.use(), "
@@ -73,44 +81,44 @@ class RequireBudgetCheck(BaseRule):
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         self._check_function_body(node)
-        self.generic_visit(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         self._check_function_body(node)
-        self.generic_visit(node)
 
     def _check_function_body(
         self, func_node: ast.FunctionDef | ast.AsyncFunctionDef
     ) -> None:
-        all_calls = self.collect_calls(func_node)
-
-        for call in all_calls:
-            if not self.is_method_call(
-                call, objects=SPEND_OBJECTS, methods=SPEND_METHODS
+        # No spend handle is ever called in this function — nothing can fire.
+        if not (self.collect_call_objects(func_node) & SPEND_OBJECTS):
+            return
+
+        all_calls = self.collect_call_info(func_node)
+
+        # Mirror NoUngovernedToolCall: each flagged call only asks "does any
+        # budget check precede me?", so the earliest budget check line answers
+        # every query without rescanning the call list.
+        first_check_line: int | None = None
+        for info in all_calls:
+            if _is_budget_check(info) and (
+                first_check_line is None or info.lineno < first_check_line
             ):
-                continue
+                first_check_line = info.lineno
 
-            target_line: int = getattr(call, "lineno", 0)
+        for info in all_calls:
+            if not _is_spend_call(info):
+                continue
 
-            has_prior_budget_check = self.calls_before(
-                all_calls,
-                target_line,
-                objects=BUDGET_OBJECTS,
-                methods=BUDGET_METHODS,
+            has_prior_budget_check = (
+                first_check_line is not None and first_check_line < info.lineno
             )
 
             if not has_prior_budget_check:
-                callee_text = self._format_callee(call)
+                callee_text = format_callee(info)
                 self.report(
-                    call,
+                    info.node,
                     f"'{callee_text}' is a spending operation but no budget check "
                     "(e.g. budget.check() or quota.can_spend()) was found before it "
                     "in the enclosing function. Check available budget before "
                     "incurring cost.",
                 )
 
-    @staticmethod
-    def _format_callee(call: ast.Call) -> str:
-        if isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name):
-            return f"{call.func.value.id}.{call.func.attr}"
-        return "<unknown>"
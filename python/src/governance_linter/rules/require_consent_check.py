@@ -16,10 +16,11 @@ absent.
 
 import ast
 
+from ._fast import format_callee, make_method_matcher
 from .base import BaseRule
 
 # Object names that typically expose data-access operations
-DATA_ACCESS_OBJECTS: set[str] = {
+DATA_ACCESS_OBJECTS: frozenset[str] = frozenset({
     "db",
     "database",
     "repo",
@@ -29,10 +30,10 @@ DATA_ACCESS_OBJECTS: set[str] = {
     "users",
     "profile",
     "customer",
-}
+})
 
 # Method names that constitute a data-access operation
-DATA_ACCESS_METHODS: set[str] = {
+DATA_ACCESS_METHODS: frozenset[str] = frozenset({
     "query",
     "find",
     "find_one",
@@ -43,25 +44,30 @@ DATA_ACCESS_METHODS: set[str] = {
     "read",
     "select",
     "load",
-}
+})
 
 # Object names that perform consent / privacy checks
-CONSENT_OBJECTS: set[str] = {"consent", "privacy", "gdpr", "permissions"}
+CONSENT_OBJECTS: frozenset[str] = frozenset({"consent", "privacy", "gdpr", "permissions"})
 
 # Method names that constitute a consent check
-CONSENT_METHODS: set[str] = {
+CONSENT_METHODS: frozenset[str] = frozenset({
     "check",
     "verify",
     "has_consent",
     "is_allowed",
     "grant",
-}
+})
+
+# Specialised matchers with the set constants bound as closure cells
+_is_consent_check = make_method_matcher(CONSENT_OBJECTS, CONSENT_METHODS)
+_is_data_access = make_method_matcher(DATA_ACCESS_OBJECTS, DATA_ACCESS_METHODS)
 
 
 class RequireConsentCheck(BaseRule):
     """Flag data-access calls that lack a prior consent check in the same scope."""
 
     rule_id = "require-consent-check"
+    trigger_terms = DATA_ACCESS_OBJECTS
     description = (
         "Require a consent check before data-access operations. Calls to "
         "db.query(), repo.find(), user.fetch(), etc. must be preceded by "
@@ -70,44 +76,45 @@ class RequireConsentCheck(BaseRule):
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
         self._check_function_body(node)
-        self.generic_visit(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
         self._check_function_body(node)
-        self.generic_visit(node)
 
     def _check_function_body(
         self, func_node: ast.FunctionDef | ast.AsyncFunctionDef
     ) -> None:
-        all_calls = self.collect_calls(func_node)
-
-        for call in all_calls:
-            if not self.is_method_call(
-                call, objects=DATA_ACCESS_OBJECTS, methods=DATA_ACCESS_METHODS
+        # No data-access handle is ever called in this function — nothing
+        # can fire.
+        if not (self.collect_call_objects(func_node) & DATA_ACCESS_OBJECTS):
+            return
+
+        all_calls = self.collect_call_info(func_node)
+
+        # Mirror NoUngovernedToolCall: each flagged call only asks "does any
+        # consent check precede me?", so the earliest consent check line answers
+        # every query without rescanning the call list.
+        first_check_line: int | None = None
+        for info in all_calls:
+            if _is_consent_check(info) and (
+                first_check_line is None or info.lineno < first_check_line
             ):
-                continue
+                first_check_line = info.lineno
 
-            target_line: int = getattr(call, "lineno", 0)
+        for info in all_calls:
+            if not _is_data_access(info):
+                continue
 
-            has_prior_consent = self.calls_before(
-                all_calls,
-                target_line,
-                objects=CONSENT_OBJECTS,
-                methods=CONSENT_METHODS,
+            has_prior_consent = (
+                first_check_line is not None and first_check_line < info.lineno
             )
 
             if not has_prior_consent:
-                callee_text = self._format_callee(call)
+                callee_text = format_callee(info)
                 self.report(
-                    call,
+                    info.node,
                     f"'{callee_text}' accesses data but no consent check "
                     "(e.g. consent.check() or privacy.verify()) was found before it "
                     "in the enclosing function. Verify consent before reading "
                     "personal data.",
                 )
 
-    @staticmethod
-    def _format_callee(call: ast.Call) -> str:
-        if isinstance(call.func, ast.Attribute) and isinstance(call.func.value, ast.Name):
-            return f"{call.func.value.id}.{call.func.attr}"
-        return "<unknown>"
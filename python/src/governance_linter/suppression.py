@@ -33,26 +33,26 @@ True
 from __future__ import annotations
 
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 
 from governance_linter.rules.base import LintViolation
 
 __all__ = ["SuppressionDetector", "SuppressionReport", "filter_suppressed"]
 
-# Matches: # governance-lint: disable=RULE_NAME  or  # governance-lint: disable
-_DISABLE_RE = re.compile(
-    r"#\s*governance-lint\s*:\s*disable(?:=([a-zA-Z0-9_\-]+))?\s*$",
+# Matches both directive forms in one engine invocation per line:
+#   # governance-lint: disable[=RULE_NAME]
+#   # governance-lint: disable-next-line[=RULE_NAME]
+# The "kind" group distinguishes them ("disable-next-line" must come first
+# in the alternation so "disable" does not swallow its prefix).
+_DIRECTIVE_RE = re.compile(
+    r"#\s*governance-lint\s*:\s*(?P<kind>disable-next-line|disable)"
+    r"(?:=(?P<rule>[\w\-]+))?\s*$",
     re.IGNORECASE,
 )
 
-# Matches: # governance-lint: disable-next-line  or  # governance-lint: disable-next-line=RULE
-_DISABLE_NEXT_RE = re.compile(
-    r"#\s*governance-lint\s*:\s*disable-next-line(?:=([a-zA-Z0-9_\-]+))?\s*$",
-    re.IGNORECASE,
-)
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SuppressionEntry:
     """A single parsed suppression directive.
 
@@ -67,7 +67,7 @@ class SuppressionEntry:
     rule: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SuppressionReport:
     """Audit record of suppressed violations.
 
@@ -96,6 +96,11 @@ class SuppressionDetector:
     ----------
     source:
         Full Python source code as a string.
+    lines:
+        Alternatively, the source already split into lines. Callers that
+        have split the file for other reasons (reporters, context
+        extraction) can pass the list to avoid a second ``splitlines``
+        copy of the whole file; *source* is then ignored.
 
     Example
     -------
@@ -105,30 +110,51 @@ class SuppressionDetector:
     True
     """
 
-    def __init__(self, source: str) -> None:
-        self._entries: list[SuppressionEntry] = []
-        self._parse(source)
-
-    def _parse(self, source: str) -> None:
-        """Extract all suppression directives from *source*."""
-        for line_index, line_text in enumerate(source.splitlines(), start=1):
-            stripped = line_text.strip()
-
-            # Check for disable-next-line first (more specific)
-            match = _DISABLE_NEXT_RE.search(stripped)
-            if match:
-                rule = match.group(1) or None
-                self._entries.append(
-                    SuppressionEntry(line=line_index, kind="disable-next-line", rule=rule)
+    def __init__(
+        self,
+        source: str | None = None,
+        *,
+        lines: list[str] | None = None,
+    ) -> None:
+        if lines is None:
+            if source is None:
+                raise ValueError(
+                    "SuppressionDetector() requires either source or lines"
                 )
+            lines = source.splitlines()
+        self._entries: list[SuppressionEntry] = []
+        # Directive lookup tables keyed by line number. Each value is the
+        # set of suppressed rule names on that line, with None meaning "all
+        # rules". is_suppressed is called once per violation, so these make
+        # it two dict probes instead of a scan over every directive.
+        self._disable: defaultdict[int, set[str | None]] = defaultdict(set)
+        self._disable_next: defaultdict[int, set[str | None]] = defaultdict(set)
+        self._parse(lines)
+
+    def _parse(self, lines: list[str]) -> None:
+        """Extract all suppression directives from the source *lines*."""
+        for line_index, line_text in enumerate(lines, start=1):
+            # Directives only live in comments, and almost no comment is a
+            # directive. The "#" membership test rejects code lines without
+            # any allocation; the lowercased substring probe (matching the
+            # regex's IGNORECASE semantics) then skips the regex engine for
+            # ordinary comments. The regex runs on the raw line — search
+            # tolerates leading text and the trailing \s*$ absorbs
+            # whitespace, so no strip() copy is needed.
+            if "#" not in line_text or "governance-lint" not in line_text.lower():
                 continue
 
-            match = _DISABLE_RE.search(stripped)
+            match = _DIRECTIVE_RE.search(line_text)
             if match:
-                rule = match.group(1) or None
+                kind = match.group("kind").lower()
+                rule = match.group("rule")
                 self._entries.append(
-                    SuppressionEntry(line=line_index, kind="disable", rule=rule)
+                    SuppressionEntry(line=line_index, kind=kind, rule=rule)
                 )
+                if kind == "disable":
+                    self._disable[line_index].add(rule)
+                else:
+                    self._disable_next[line_index].add(rule)
 
     def is_suppressed(self, line: int, rule: str) -> bool:
         """Return True if *rule* on *line* is covered by a suppression directive.
@@ -145,18 +171,14 @@ class SuppressionDetector:
         bool:
             True if any suppression directive covers this (line, rule) pair.
         """
-        for entry in self._entries:
-            # disable directive on the same line as the violation
-            if entry.kind == "disable" and entry.line == line:
-                if entry.rule is None or entry.rule == rule:
-                    return True
-
-            # disable-next-line on the line immediately before the violation
-            if entry.kind == "disable-next-line" and entry.line == line - 1:
-                if entry.rule is None or entry.rule == rule:
-                    return True
+        # disable directive on the same line as the violation
+        on_line = self._disable.get(line)
+        if on_line is not None and (rule in on_line or None in on_line):
+            return True
 
-        return False
+        # disable-next-line on the line immediately before the violation
+        on_prev = self._disable_next.get(line - 1)
+        return on_prev is not None and (rule in on_prev or None in on_prev)
 
     @property
     def directive_count(self) -> int:
@@ -166,7 +188,9 @@ class SuppressionDetector:
 
 def filter_suppressed(
     violations: list[LintViolation],
-    source: str,
+    source: str | None = None,
+    *,
+    detector: SuppressionDetector | None = None,
 ) -> SuppressionReport:
     """Partition *violations* into suppressed and active using inline directives.
 
@@ -176,6 +200,10 @@ def filter_suppressed(
         All ``LintViolation`` instances returned by the linter for a file.
     source:
         The Python source code of the file (used to parse suppression comments).
+    detector:
+        A previously built :class:`SuppressionDetector` for the same source.
+        Passing one lets callers that filter the same file repeatedly (e.g.
+        per rule batch) parse its directives once; *source* is then ignored.
 
     Returns
     -------
@@ -183,12 +211,35 @@ def filter_suppressed(
         ``suppressed``: violations covered by an inline directive.
         ``active``:     violations that remain active after applying directives.
     """
-    detector = SuppressionDetector(source)
+    if detector is None:
+        if source is None:
+            raise ValueError("filter_suppressed() requires either source or detector")
+        detector = SuppressionDetector(source)
+
+    if not detector.directive_count:
+        return SuppressionReport(suppressed=[], active=list(violations))
+
+    # Directives are rare relative to violations, so instead of querying
+    # is_suppressed once per violation, bucket the violations by line and
+    # walk the detector's per-line tables — O(violations + directives).
+    by_line: defaultdict[int, list[LintViolation]] = defaultdict(list)
+    for violation in violations:
+        by_line[violation.line].append(violation)
+
+    suppressed_ids: set[int] = set()
+    for directive_line, rules in detector._disable.items():
+        for violation in by_line.get(directive_line, ()):
+            if None in rules or violation.rule in rules:
+                suppressed_ids.add(id(violation))
+    for directive_line, rules in detector._disable_next.items():
+        for violation in by_line.get(directive_line + 1, ()):
+            if None in rules or violation.rule in rules:
+                suppressed_ids.add(id(violation))
+
     suppressed: list[LintViolation] = []
     active: list[LintViolation] = []
-
     for violation in violations:
-        if detector.is_suppressed(violation.line, violation.rule):
+        if id(violation) in suppressed_ids:
             suppressed.append(violation)
         else:
             active.append(violation)
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 import textwrap
+from pathlib import Path
 from typing import Callable
 
 import pytest
@@ -27,19 +28,10 @@ from governance_linter.rules.require_consent_check import RequireConsentCheck
 # ---------------------------------------------------------------------------
 
 def _lint_source(source: str, rule_classes: list | None = None) -> list[LintViolation]:
-    """Lint inline Python source string using a temp file."""
-    import tempfile
+    """Lint inline Python source in memory via ``lint_source``."""
     dedented = textwrap.dedent(source).strip()
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".py", encoding="utf-8", delete=False
-    ) as fh:
-        fh.write(dedented)
-        tmp_path = fh.name
-    try:
-        linter = GovernanceLinter(rules=rule_classes)
-        return linter.lint_file(tmp_path)
-    finally:
-        os.unlink(tmp_path)
+    linter = GovernanceLinter(rules=rule_classes)
+    return linter.lint_source(dedented)
 
 
 # ---------------------------------------------------------------------------
@@ -295,3 +287,68 @@ class TestGovernanceLinter:
     def test_all_five_rules_registered_by_default(self) -> None:
         linter = GovernanceLinter()
         assert len(linter.rule_classes) == 5
+
+
+# ---------------------------------------------------------------------------
+# TestParallelLinting
+# ---------------------------------------------------------------------------
+
+
+class TestParallelLinting:
+    @staticmethod
+    def _write_tree(root: Path) -> list[str]:
+        """Write a handful of files with known violations; return their paths."""
+        paths: list[str] = []
+        for index in range(4):
+            path = root / f"mod_{index}.py"
+            path.write_text(
+                f'def run_{index}():\n    tool.run("task {index}")\n',
+                encoding="utf-8",
+            )
+            paths.append(str(path))
+        return paths
+
+    def test_lint_paths_parallel_matches_serial(self, tmp_path: Path) -> None:
+        paths = self._write_tree(tmp_path)
+        linter = GovernanceLinter(rules=[NoUngovernedToolCall])
+
+        serial = linter.lint_paths(paths, jobs=1)
+        parallel = linter.lint_paths(paths, jobs=2)
+
+        assert len(serial) == len(paths)
+        assert parallel == serial
+
+    def test_lint_directory_parallel_matches_serial(self, tmp_path: Path) -> None:
+        self._write_tree(tmp_path)
+        linter = GovernanceLinter(rules=[NoUngovernedToolCall])
+
+        serial = linter.lint_directory(str(tmp_path), jobs=1)
+        parallel = linter.lint_directory(str(tmp_path), jobs=2)
+
+        assert serial
+        assert parallel == serial
+
+    def test_parallel_run_serves_cache_hits_from_parent(self, tmp_path: Path) -> None:
+        from governance_linter import ScanCache
+        from governance_linter.cache import rules_hash
+
+        paths = self._write_tree(tmp_path)
+        cache = ScanCache(cache_dir=str(tmp_path / "cache"))
+        key = rules_hash(["no-ungoverned-tool-call"])
+
+        # Pre-seed one file with a sentinel result: if the parallel run
+        # serves it from the parent-side cache (rather than re-linting in a
+        # worker), the sentinel surfaces in the output.
+        sentinel = LintViolation(
+            rule="cached-sentinel", message="from cache", file=paths[0], line=1, col=0
+        )
+        cache.put(paths[0], key, os.stat(paths[0]), [sentinel])
+
+        linter = GovernanceLinter(rules=[NoUngovernedToolCall], cache=cache)
+        violations = linter.lint_paths(paths, jobs=2)
+
+        assert violations[0] == sentinel
+        assert [v.file for v in violations[1:]] == paths[1:]
+        # Worker results for the misses are stored back into the cache.
+        for path in paths[1:]:
+            assert cache.get(path, key, os.stat(path)) is not None